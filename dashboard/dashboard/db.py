@@ -153,6 +153,8 @@ class DatabaseClient:
 
         ALTER TABLE github_pull_requests ADD COLUMN IF NOT EXISTS first_commit_at TIMESTAMPTZ;
         ALTER TABLE github_pull_requests ADD COLUMN IF NOT EXISTS first_claude_chat_at TIMESTAMPTZ;
+        ALTER TABLE github_pull_requests ADD COLUMN IF NOT EXISTS first_reviewer_login VARCHAR(255);
+        ALTER TABLE github_pull_requests ADD COLUMN IF NOT EXISTS approver_login VARCHAR(255);
 
         CREATE INDEX IF NOT EXISTS idx_pr_author ON github_pull_requests(author_login);
         CREATE INDEX IF NOT EXISTS idx_pr_repo ON github_pull_requests(repo_full_name);
@@ -180,13 +182,14 @@ class DatabaseClient:
                     INSERT INTO github_pull_requests (
                         repo_full_name, pr_number, title, author_login, state,
                         draft, created_at, first_commit_at, first_claude_chat_at,
-                        first_review_at, approved_at, merged_at, closed_at,
-                        additions, deletions, changed_files,
+                        first_review_at, first_reviewer_login, approved_at, approver_login,
+                        merged_at, closed_at, additions, deletions, changed_files,
                         head_branch, base_branch, raw_data, synced_at
                     ) VALUES (
                         %(repo_full_name)s, %(pr_number)s, %(title)s, %(author_login)s,
                         %(state)s, %(draft)s, %(created_at)s, %(first_commit_at)s,
-                        %(first_claude_chat_at)s, %(first_review_at)s, %(approved_at)s,
+                        %(first_claude_chat_at)s, %(first_review_at)s,
+                        %(first_reviewer_login)s, %(approved_at)s, %(approver_login)s,
                         %(merged_at)s, %(closed_at)s, %(additions)s, %(deletions)s,
                         %(changed_files)s, %(head_branch)s, %(base_branch)s,
                         %(raw_data)s, NOW()
@@ -198,7 +201,9 @@ class DatabaseClient:
                         first_commit_at = EXCLUDED.first_commit_at,
                         first_claude_chat_at = EXCLUDED.first_claude_chat_at,
                         first_review_at = EXCLUDED.first_review_at,
+                        first_reviewer_login = EXCLUDED.first_reviewer_login,
                         approved_at = EXCLUDED.approved_at,
+                        approver_login = EXCLUDED.approver_login,
                         merged_at = EXCLUDED.merged_at,
                         closed_at = EXCLUDED.closed_at,
                         additions = EXCLUDED.additions,
@@ -255,6 +260,93 @@ class DatabaseClient:
             logger.error(f"Failed to fetch PRs: {e}")
             return []
 
+    def get_cycle_time_rows(
+        self,
+        repo: str | None = None,
+        author: str | None = None,
+        days: int = 30,
+    ) -> list[dict]:
+        """Fetch merged PRs with only the fields cycle time metrics need.
+
+        Like get_prs(merged_only=True), but raw_data is trimmed server-side to
+        each review's author, state and timestamp (review bodies are dropped).
+        """
+        self.ensure_connected()
+
+        query = """
+            SELECT
+                pr_number, repo_full_name, title, author_login,
+                first_claude_chat_at, first_commit_at, created_at, merged_at,
+                first_review_at, first_reviewer_login, approved_at, approver_login,
+                jsonb_build_object('reviews', (
+                    SELECT COALESCE(jsonb_agg(jsonb_strip_nulls(jsonb_build_object(
+                        'author', r->'author',
+                        'user', r->'user',
+                        'state', r->'state',
+                        'submittedAt', r->'submittedAt',
+                        'submitted_at', r->'submitted_at'
+                    ))), '[]'::jsonb)
+                    FROM jsonb_array_elements(raw_data->'reviews') AS r
+                )) AS raw_data
+            FROM github_pull_requests
+            WHERE created_at > NOW() - INTERVAL '%s days'
+              AND merged_at IS NOT NULL
+        """
+        params: list[Any] = [days]
+
+        if repo:
+            query += " AND repo_full_name = %s"
+            params.append(repo)
+
+        if author:
+            query += " AND author_login = %s"
+            params.append(author)
+
+        query += " ORDER BY created_at DESC"
+
+        try:
+            with self._conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(query, params)
+                return [dict(row) for row in cur.fetchall()]
+        except psycopg2.Error as e:
+            logger.error(f"Failed to fetch cycle time rows: {e}")
+            return []
+
+    def get_summary_aggregates(self, days: int = 30) -> dict:
+        """Get overview counts for PRs created in the last `days` days.
+
+        Returns dict with total_prs, merged_prs, open_prs, avg_cycle_time_hours
+        (created to merged, merged PRs only) and unique_authors.
+        """
+        self.ensure_connected()
+
+        try:
+            with self._conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    """
+                    SELECT
+                        COUNT(*) AS total_prs,
+                        COUNT(merged_at) AS merged_prs,
+                        COUNT(*) FILTER (WHERE state = 'open') AS open_prs,
+                        (AVG(EXTRACT(EPOCH FROM merged_at - created_at)) / 3600)::float
+                            AS avg_cycle_time_hours,
+                        COUNT(DISTINCT author_login) AS unique_authors
+                    FROM github_pull_requests
+                    WHERE created_at > NOW() - INTERVAL '%s days'
+                    """,
+                    (days,),
+                )
+                return dict(cur.fetchone())
+        except psycopg2.Error as e:
+            logger.error(f"Failed to fetch summary aggregates: {e}")
+            return {
+                "total_prs": 0,
+                "merged_prs": 0,
+                "open_prs": 0,
+                "avg_cycle_time_hours": None,
+                "unique_authors": 0,
+            }
+
     def get_repos(self) -> list[str]:
         """Get list of unique repos in the database."""
         self.ensure_connected()
@@ -56,19 +56,25 @@ def transform_graphql_pr(pr: dict, repo_full_name: str, first_claude_chat: datet
     # Extract reviews
     reviews = pr.get("reviews", {}).get("nodes", [])
 
-    # Find first review and approval timestamps
+    # Find first review and approval timestamps, and who submitted them
     first_review_at = None
+    first_reviewer_login = None
     approved_at = None
+    approver_login = None
     for review in sorted(reviews, key=lambda r: r.get("submittedAt") or ""):
         submitted = parse_timestamp(review.get("submittedAt"))
         if not submitted:
             continue
 
+        login = (review.get("author") or {}).get("login")
+
         if first_review_at is None:
             first_review_at = submitted
+            first_reviewer_login = login
 
         if review.get("state") == "APPROVED" and approved_at is None:
             approved_at = submitted
+            approver_login = login
 
     # Extract first commit timestamp
     commits = pr.get("commits", {}).get("nodes", [])
@@ -98,7 +104,9 @@ def transform_graphql_pr(pr: dict, repo_full_name: str, first_claude_chat: datet
         "first_commit_at": first_commit_at,
         "first_claude_chat_at": first_claude_chat,
         "first_review_at": first_review_at,
+        "first_reviewer_login": first_reviewer_login,
         "approved_at": approved_at,
+        "approver_login": approver_login,
         "merged_at": parse_timestamp(pr.get("mergedAt")),
         "closed_at": parse_timestamp(pr.get("closedAt")),
         "additions": pr.get("additions"),
@@ -27,6 +27,9 @@ def run_sync(config: Config, db: DatabaseClient):
         # Run the async sync in a new event loop since we're in a background thread
         stats = asyncio.run(sync_all_repos(config, db))
         logger.info(f"Sync complete: {stats['total_synced']} PRs synced")
+        # Invalidate caches keyed on the data version (repo/author lists)
+        if stats["total_synced"]:
+            app.state.data_version += 1
     except Exception as e:
         logger.error(f"Sync failed: {e}")
 
@@ -39,6 +42,7 @@ async def lifespan(app: FastAPI):
     app.state.config = config
     app.state.db = None
     app.state.db_error = None
+    app.state.data_version = 0
     scheduler = None
 
     # Initialize database (gracefully handle missing config)
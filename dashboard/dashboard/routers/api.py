@@ -1,11 +1,12 @@
 """JSON API endpoints for metrics."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from ..db import DatabaseClient
 from ..services import metrics
 
-router = APIRouter(prefix="/api", tags=["api"])
+router = APIRouter(prefix="/api", tags=["api"], default_response_class=ORJSONResponse)
 
 
 def get_db() -> DatabaseClient:
@@ -33,16 +34,19 @@ async def get_cycle_time(
     repo: str | None = None,
     author: str | None = None,
     days: int = Query(30, ge=1, le=365),
+    include_prs: bool = True,
     db: DatabaseClient = Depends(get_db),
 ):
     """Get PR cycle time breakdown metrics."""
-    return metrics.get_cycle_time_metrics(db, repo=repo, author=author, days=days)
+    return metrics.get_cycle_time_metrics(
+        db, repo=repo, author=author, days=days, include_prs=include_prs
+    )
 
 
 @router.get("/metrics/velocity")
 async def get_velocity(
     repo: str | None = None,
-    granularity: str = Query("week", regex="^(week|month)$"),
+    granularity: metrics.Granularity = metrics.Granularity.WEEK,
     days: int = Query(90, ge=1, le=365),
     db: DatabaseClient = Depends(get_db),
 ):
@@ -1,10 +1,17 @@
 """HTML dashboard views."""
 
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 
 from ..db import DatabaseClient
 from ..services import metrics
@@ -29,6 +36,43 @@ def to_utc_iso(dt: datetime | None) -> str:
 templates.env.filters["utc_iso"] = to_utc_iso
 
 
+def _orjson_dumps(obj: Any, sort_keys: bool = False, indent: int | None = None) -> str:
+    """JSON encoder for Jinja's tojson filter (orjson instead of stdlib json).
+
+    Jinja passes the json.dumps_kwargs policy (sort_keys=True by default) plus
+    any filter arguments. orjson only supports a 2-space indent, so any other
+    indent raises instead of being silently dropped.
+    """
+    option = 0
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent is not None:
+        if indent != 2:
+            raise ValueError(f"tojson supports indent=2 only, got indent={indent!r}")
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, option=option).decode()
+
+
+templates.env.policies["json.dumps_function"] = _orjson_dumps
+
+# Number of rendered fragments to batch per chunk when streaming templates
+STREAM_BUFFER_SIZE = 64
+
+
+def stream_template(name: str, context: dict) -> StreamingResponse:
+    """Render a template incrementally instead of buffering the whole page.
+
+    Used for pages with long tables so the first bytes go out while the rest
+    renders (Starlette iterates the sync generator in its threadpool).
+    """
+    stream = templates.get_template(name).stream(context)
+    stream.enable_buffering(STREAM_BUFFER_SIZE)
+    return StreamingResponse(
+        (chunk.encode("utf-8") for chunk in stream),
+        media_type="text/html",
+    )
+
+
 def get_db() -> DatabaseClient | None:
     """Get database client from app state (may be None)."""
     from ..main import app
@@ -41,6 +85,74 @@ def get_db_error() -> str | None:
     return app.state.db_error
 
 
+# Seconds a cached repo/author list stays valid when no sync bumps data_version
+FILTER_CACHE_TTL = 300.0
+
+# (data_version, expires_at, values) per (list name, db client)
+_filter_cache: dict[tuple[str, DatabaseClient], tuple[int, float, list[str]]] = {}
+
+
+def _cached_list(name: str, db: DatabaseClient, fetch: Callable[[], list[str]]) -> list[str]:
+    """Fetch a filter list once per data version, expiring after FILTER_CACHE_TTL.
+
+    Empty results are not cached: the DB client returns [] on errors, and a
+    transient failure must not stick until the next sync.
+    """
+    from ..main import app
+    data_version = app.state.data_version
+    now = time.monotonic()
+
+    entry = _filter_cache.get((name, db))
+    if entry is not None and entry[0] == data_version and entry[1] > now:
+        return entry[2]
+
+    values = fetch()
+    if values:
+        _filter_cache[(name, db)] = (data_version, now + FILTER_CACHE_TTL, values)
+    return values
+
+
+def get_repos(db: DatabaseClient | None = Depends(get_db)) -> list[str]:
+    """Get the list of tracked repos, cached until the next sync or the TTL."""
+    if db is None:
+        return []
+    return _cached_list("repos", db, db.get_repos)
+
+
+def get_authors(db: DatabaseClient | None = Depends(get_db)) -> list[str]:
+    """Get the list of PR authors, cached until the next sync or the TTL."""
+    if db is None:
+        return []
+    return _cached_list("authors", db, db.get_authors)
+
+
+# Metric fetches currently running, keyed by call signature
+_inflight: dict[tuple, asyncio.Task] = {}
+
+
+async def _singleflight(key: tuple, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking fetch in the threadpool, coalescing concurrent identical calls.
+
+    While a fetch for `key` is running, other callers await its result instead
+    of issuing the same query again. The fetch runs as its own task, so
+    cancelling any one caller (including the one that started it) does not
+    cancel it for the others.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(run_in_threadpool(fn, *args, **kwargs))
+        _inflight[key] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            if _inflight.get(key) is finished:
+                del _inflight[key]
+            if not finished.cancelled():
+                finished.exception()  # Mark retrieved so asyncio does not warn when every caller left
+
+        task.add_done_callback(_done)
+    return await asyncio.shield(task)
+
+
 def format_hours(hours: float | None) -> str:
     """Format hours as human-readable string."""
     if hours is None:
@@ -53,39 +165,44 @@ def format_hours(hours: float | None) -> str:
     return f"{days:.1f}d"
 
 
+# Helpers used across templates, registered once instead of per-request context
+templates.env.globals.update(
+    format_hours=format_hours,
+    extract_content_text=metrics.extract_content_text,
+    get_display_role=metrics.get_display_role,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class DashboardCtx:
+    """Template context for the overview page."""
+
+    summary: dict | None
+    repos: list[str]
+    days: int
+    db_error: str | None
+
+
 @router.get("/", response_class=HTMLResponse)
 async def dashboard_home(
     request: Request,
     days: int = Query(30, ge=1, le=365),
     db: DatabaseClient | None = Depends(get_db),
     db_error: str | None = Depends(get_db_error),
+    repos: list[str] = Depends(get_repos),
 ):
     """Main dashboard view with summary metrics."""
     if db is None:
-        return templates.TemplateResponse(
-            "dashboard.html",
-            {
-                "request": request,
-                "summary": None,
-                "repos": [],
-                "days": days,
-                "format_hours": format_hours,
-                "db_error": db_error,
-            },
-        )
-
-    summary = metrics.get_summary_metrics(db, days=days)
-    repos = db.get_repos()
+        ctx = DashboardCtx(summary=None, repos=[], days=days, db_error=db_error)
+    else:
+        summary = await _singleflight(("summary", days), metrics.get_summary_metrics, db, days=days)
+        ctx = DashboardCtx(summary=summary, repos=repos, days=days, db_error=None)
 
     return templates.TemplateResponse(
         "dashboard.html",
         {
             "request": request,
-            "summary": summary,
-            "repos": repos,
-            "days": days,
-            "format_hours": format_hours,
-            "db_error": None,
+            "ctx": ctx,
         },
     )
 
@@ -94,10 +211,11 @@ async def dashboard_home(
 async def velocity_view(
     request: Request,
     repo: str | None = None,
-    granularity: str = Query("week", regex="^(week|month)$"),
+    granularity: metrics.Granularity = metrics.Granularity.WEEK,
     days: int = Query(90, ge=1, le=365),
     db: DatabaseClient | None = Depends(get_db),
     db_error: str | None = Depends(get_db_error),
+    repos: list[str] = Depends(get_repos),
 ):
     """Shipping velocity charts."""
     if db is None:
@@ -115,7 +233,6 @@ async def velocity_view(
         )
 
     velocity = metrics.get_velocity_metrics(db, repo=repo, granularity=granularity, days=days)
-    repos = db.get_repos()
 
     return templates.TemplateResponse(
         "velocity.html",
@@ -139,6 +256,8 @@ async def cycle_time_view(
     days: int = Query(30, ge=1, le=365),
     db: DatabaseClient | None = Depends(get_db),
     db_error: str | None = Depends(get_db_error),
+    repos: list[str] = Depends(get_repos),
+    authors: list[str] = Depends(get_authors),
 ):
     """PR cycle time breakdown view."""
     if db is None:
@@ -163,14 +282,11 @@ async def cycle_time_view(
                 "selected_repo": repo,
                 "selected_author": author,
                 "days": days,
-                "format_hours": format_hours,
                 "db_error": db_error,
             },
         )
 
     cycle_time = metrics.get_cycle_time_metrics(db, repo=repo, author=author, days=days)
-    repos = db.get_repos()
-    authors = db.get_authors()
 
     return templates.TemplateResponse(
         "cycle_time.html",
@@ -182,7 +298,6 @@ async def cycle_time_view(
             "selected_repo": repo,
             "selected_author": author,
             "days": days,
-            "format_hours": format_hours,
             "db_error": None,
         },
     )
@@ -207,8 +322,6 @@ async def interventions_view(
                 "selected_author": author,
                 "days": days,
                 "db_error": db_error,
-                "extract_content_text": metrics.extract_content_text,
-                "get_display_role": metrics.get_display_role,
             },
         )
 
@@ -224,8 +337,6 @@ async def interventions_view(
             "selected_author": author,
             "days": days,
             "db_error": None,
-            "extract_content_text": metrics.extract_content_text,
-            "get_display_role": metrics.get_display_role,
         },
     )
 
@@ -238,10 +349,12 @@ async def interventions_by_pr_view(
     days: int = Query(30, ge=1, le=365),
     db: DatabaseClient | None = Depends(get_db),
     db_error: str | None = Depends(get_db_error),
+    repos: list[str] = Depends(get_repos),
+    authors: list[str] = Depends(get_authors),
 ):
     """Human interventions aggregated by PR."""
     if db is None:
-        return templates.TemplateResponse(
+        return stream_template(
             "interventions_by_pr.html",
             {
                 "request": request,
@@ -262,8 +375,6 @@ async def interventions_by_pr_view(
         )
 
     prs = db.get_interventions_by_pr(days=days, repo=repo, author=author)
-    repos = db.get_repos()
-    authors = db.get_authors()
 
     # Calculate summary metrics
     total_prs = len(prs)
@@ -281,7 +392,7 @@ async def interventions_by_pr_view(
         "avg_minutes_between": round(avg_minutes_between, 1) if avg_minutes_between else None,
     }
 
-    return templates.TemplateResponse(
+    return stream_template(
         "interventions_by_pr.html",
         {
             "request": request,
@@ -307,7 +418,7 @@ async def pr_timeline_view(
 ):
     """PR timeline detail view with Claude chats and review history."""
     if db is None:
-        return templates.TemplateResponse(
+        return stream_template(
             "pr_timeline.html",
             {
                 "request": request,
@@ -317,15 +428,13 @@ async def pr_timeline_view(
                 "review_summary": "",
                 "db_error": db_error,
                 "not_found": False,
-                "extract_content_text": metrics.extract_content_text,
-                "get_display_role": metrics.get_display_role,
             },
         )
 
     # Fetch PR data
     pr = db.get_pr_by_repo_and_number(repo_full_name, pr_number)
     if not pr:
-        return templates.TemplateResponse(
+        return stream_template(
             "pr_timeline.html",
             {
                 "request": request,
@@ -335,8 +444,6 @@ async def pr_timeline_view(
                 "review_summary": "",
                 "db_error": None,
                 "not_found": True,
-                "extract_content_text": metrics.extract_content_text,
-                "get_display_role": metrics.get_display_role,
             },
         )
 
@@ -351,7 +458,7 @@ async def pr_timeline_view(
     # Generate review summary
     review_summary = metrics.generate_review_summary(pr)
 
-    return templates.TemplateResponse(
+    return stream_template(
         "pr_timeline.html",
         {
             "request": request,
@@ -361,8 +468,6 @@ async def pr_timeline_view(
             "review_summary": review_summary,
             "db_error": None,
             "not_found": False,
-            "extract_content_text": metrics.extract_content_text,
-            "get_display_role": metrics.get_display_role,
         },
     )
 
@@ -388,8 +493,6 @@ async def partial_intervention_context(
             "request": request,
             "context_before": context["context_before"],
             "context_after": context["context_after"],
-            "extract_content_text": metrics.extract_content_text,
-            "get_display_role": metrics.get_display_role,
         },
     )
 
@@ -401,14 +504,13 @@ async def partial_summary(
     db: DatabaseClient = Depends(get_db),
 ):
     """Partial template for summary cards (HTMX)."""
-    summary = metrics.get_summary_metrics(db, days=days)
+    summary = await _singleflight(("summary", days), metrics.get_summary_metrics, db, days=days)
 
     return templates.TemplateResponse(
         "partials/summary_cards.html",
         {
             "request": request,
             "summary": summary,
-            "format_hours": format_hours,
         },
     )
 
@@ -430,6 +532,5 @@ async def partial_pr_interventions(
         {
             "request": request,
             "interventions": interventions,
-            "extract_content_text": metrics.extract_content_text,
         },
     )
@@ -1,6 +1,13 @@
 """Metrics calculation service."""
 
+import heapq
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterator
 from datetime import datetime, timedelta
+from enum import StrEnum
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 from ..db import DatabaseClient
@@ -14,14 +21,30 @@ BOT_PATTERNS = [
     "claude",
     "copilot",
 ]
+_BOT_RE = re.compile("|".join(re.escape(pattern) for pattern in BOT_PATTERNS))
+# GitHub App logins end with this suffix; checked before the pattern scan
+_BOT_SUFFIX = "[bot]"
 
 
+class Granularity(StrEnum):
+    """Time bucket used for velocity metrics."""
+
+    WEEK = "week"
+    MONTH = "month"
+
+
+@lru_cache(maxsize=4096)
 def is_bot_user(username: str) -> bool:
-    """Check if a username appears to be a bot."""
+    """Check if a username appears to be a bot.
+
+    Cached since the same reviewer logins recur across nearly every PR.
+    """
     if not username:
         return False
     username_lower = username.lower()
-    return any(pattern in username_lower for pattern in BOT_PATTERNS)
+    if username_lower.endswith(_BOT_SUFFIX):
+        return True
+    return _BOT_RE.search(username_lower) is not None
 
 
 def hours_between(start: datetime | None, end: datetime | None) -> float | None:
@@ -32,73 +55,157 @@ def hours_between(start: datetime | None, end: datetime | None) -> float | None:
     return delta.total_seconds() / 3600
 
 
+@lru_cache(maxsize=65536)
+def _parse_iso(ts: str) -> datetime:
+    """Parse an ISO 8601 string, cached since review timestamps recur across PRs.
+
+    fromisoformat accepts a trailing "Z" natively on Python 3.11+.
+    """
+    return datetime.fromisoformat(ts)
+
+
 def parse_review_timestamp(ts: str | None) -> datetime | None:
     """Parse GitHub timestamp string to datetime."""
-    if not ts:
+    if not ts or not isinstance(ts, str):
         return None
     try:
-        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
+        return _parse_iso(ts)
+    except ValueError:
         return None
 
 
+def _normalize_reviews(pr: dict) -> list[dict]:
+    """Parse raw_data.reviews into review events sorted by submission time.
+
+    The result is memoized on the PR dict so the cycle time, timeline and
+    review summary for a PR share a single pass over its reviews.
+    """
+    cached = pr.get("_normalized_reviews")
+    if cached is not None:
+        return cached
+
+    # Nothing to normalize without reviews; skip the loop setup
+    raw_data = pr.get("raw_data")
+    if not raw_data:
+        return []
+    reviews = raw_data.get("reviews")
+    if not reviews:
+        return []
+
+    # Handle both GraphQL (author/submittedAt) and REST (user/submitted_at)
+    # formats. Detect the format from the first review and try its keys
+    # first; the other format's keys are only read when those miss.
+    first = reviews[0]
+    if "submittedAt" in first or "author" in first:
+        login_key, alt_login_key = "author", "user"
+        ts_key, alt_ts_key = "submittedAt", "submitted_at"
+    else:
+        login_key, alt_login_key = "user", "author"
+        ts_key, alt_ts_key = "submitted_at", "submittedAt"
+
+    # Bind hot lookups to locals for the per-review loop
+    events = []
+    append = events.append
+    parse = parse_review_timestamp
+    is_bot = is_bot_user
+    prev_submitted = None
+    needs_sort = False
+    for review in reviews:
+        # The reviewer may be missing or null (e.g. deleted accounts)
+        try:
+            reviewer = review[login_key]["login"]
+        except (KeyError, TypeError):
+            reviewer = None
+        if not reviewer:
+            try:
+                reviewer = review[alt_login_key]["login"] or "unknown"
+            except (KeyError, TypeError):
+                reviewer = "unknown"
+        submitted = parse(review.get(ts_key)) or parse(review.get(alt_ts_key))
+        if not submitted:
+            continue
+        if prev_submitted is not None and submitted < prev_submitted:
+            needs_sort = True
+        prev_submitted = submitted
+
+        append({
+            "reviewer": reviewer,
+            "state": review.get("state", "COMMENTED"),
+            "body": review.get("body") or "",
+            "submitted_at": submitted,
+            "is_bot": is_bot(reviewer),
+        })
+
+    # GitHub returns reviews in submission order, so only sort when needed
+    if needs_sort:
+        events.sort(key=itemgetter("submitted_at"))
+    pr["_normalized_reviews"] = events
+    return events
+
+
+def iter_human_reviews(pr: dict) -> Iterator[dict]:
+    """Yield a PR's non-bot review events in submission order."""
+    for review in _normalize_reviews(pr):
+        if not review["is_bot"]:
+            yield review
+
+
 def get_human_review_times(pr: dict) -> tuple[datetime | None, datetime | None]:
     """Extract first human review and approval times from raw_data.
 
     Handles both GraphQL and REST API response formats.
     Filters out bot reviewers to get accurate human review metrics.
     """
-    raw_data = pr.get("raw_data") or {}
-    reviews = raw_data.get("reviews") or []
-
     first_review_at = None
     approved_at = None
 
-    # Sort reviews by timestamp (handle both GraphQL and REST formats)
-    sorted_reviews = sorted(
-        reviews,
-        key=lambda r: r.get("submittedAt") or r.get("submitted_at") or ""
-    )
+    # Reviews are in submission order, so both times are known once the
+    # first human approval is reached
+    for review in iter_human_reviews(pr):
+        if first_review_at is None:
+            first_review_at = review["submitted_at"]
 
-    for review in sorted_reviews:
-        # Handle both GraphQL (author) and REST (user) formats
-        reviewer = (
-            review.get("author", {}).get("login")
-            or review.get("user", {}).get("login")
-            or ""
-        )
-        if is_bot_user(reviewer):
-            continue
+        if review["state"] == "APPROVED":
+            approved_at = review["submitted_at"]
+            break
 
-        # Handle both GraphQL (submittedAt) and REST (submitted_at) formats
-        submitted = (
-            parse_review_timestamp(review.get("submittedAt"))
-            or parse_review_timestamp(review.get("submitted_at"))
-        )
-        if not submitted:
-            continue
+    return first_review_at, approved_at
 
-        if first_review_at is None:
-            first_review_at = submitted
 
-        if review.get("state") == "APPROVED" and approved_at is None:
-            approved_at = submitted
+def stored_reviews_are_human(pr: dict) -> bool:
+    """Check whether the stored first review and approval came from humans.
 
-    return first_review_at, approved_at
+    When they did, the stored first_review_at/approved_at already equal the
+    human-only times and raw_data does not need to be walked. Rows synced
+    before the reviewer logins were recorded always return False.
+    """
+    if "first_reviewer_login" not in pr:
+        return False
+    for at_key, login_key in (
+        ("first_review_at", "first_reviewer_login"),
+        ("approved_at", "approver_login"),
+    ):
+        if pr.get(at_key) is not None:
+            login = pr.get(login_key)
+            if not login or is_bot_user(login):
+                return False
+    return True
 
 
 def calculate_pr_cycle_time(pr: dict, filter_bots: bool = True) -> dict:
     """Calculate cycle time breakdown for a single PR.
 
-    If filter_bots is True, uses human-only review times from raw_data.
-    Otherwise uses the stored first_review_at/approved_at timestamps.
+    If filter_bots is True, uses human-only review times. These come from the
+    stored timestamps when the stored first reviewer and approver are known
+    humans, and from raw_data otherwise. If filter_bots is False, uses the
+    stored first_review_at/approved_at timestamps as-is.
     """
     first_claude_chat = pr.get("first_claude_chat_at")
     first_commit = pr.get("first_commit_at")
     created = pr.get("created_at")
     merged = pr.get("merged_at")
 
-    if filter_bots:
+    if filter_bots and not stored_reviews_are_human(pr):
         first_review, approved = get_human_review_times(pr)
     else:
         first_review = pr.get("first_review_at")
@@ -117,8 +224,10 @@ def calculate_pr_cycle_time(pr: dict, filter_bots: bool = True) -> dict:
         hours_before_pr = None
 
     # For total time, use the earliest available timestamp as start
-    timestamps = [t for t in [first_claude_chat, first_commit, created] if t is not None]
-    start_time = min(timestamps) if timestamps else None
+    start_time = min(
+        (t for t in (first_claude_chat, first_commit, created) if t is not None),
+        default=None,
+    )
 
     return {
         "pr_number": pr["pr_number"],
@@ -138,14 +247,33 @@ def calculate_pr_cycle_time(pr: dict, filter_bots: bool = True) -> dict:
     }
 
 
+# Per-PR cycle time fields that get_cycle_time_metrics averages
+CYCLE_TIME_FIELDS = (
+    "hours_before_first_commit",
+    "hours_before_pr",
+    "hours_to_first_review",
+    "hours_to_approval",
+    "hours_to_merge",
+    "total_hours",
+)
+
+
 def get_cycle_time_metrics(
     db: DatabaseClient,
     repo: str | None = None,
     author: str | None = None,
     days: int = 30,
+    include_prs: bool = True,
 ) -> dict:
-    """Get aggregated cycle time metrics."""
-    prs = db.get_prs(repo=repo, author=author, days=days, merged_only=True)
+    """Get aggregated cycle time metrics.
+
+    With include_prs=False the per-PR breakdown is left out ("prs" is empty)
+    and only the columns needed for the averages are fetched.
+    """
+    if include_prs:
+        prs = db.get_prs(repo=repo, author=author, days=days, merged_only=True)
+    else:
+        prs = db.get_cycle_time_rows(repo=repo, author=author, days=days)
 
     if not prs:
         return {
@@ -163,43 +291,48 @@ def get_cycle_time_metrics(
 
     cycle_times = [calculate_pr_cycle_time(pr) for pr in prs]
 
-    # Calculate averages, ignoring None values
-    def avg(values: list[float | None]) -> float | None:
-        valid = [v for v in values if v is not None]
-        return sum(valid) / len(valid) if valid else None
-
-    # Calculate percentage of PRs merged without any review
-    prs_without_review = [ct for ct in cycle_times if ct["hours_to_first_review"] is None]
-    prs_without_review_count = len(prs_without_review)
-    prs_without_review_pct = (prs_without_review_count / len(prs) * 100) if prs else 0
+    # Sum each field in a single pass, ignoring None values
+    sums = dict.fromkeys(CYCLE_TIME_FIELDS, 0.0)
+    counts = dict.fromkeys(CYCLE_TIME_FIELDS, 0)
+    prs_without_review_count = 0
+    for ct in cycle_times:
+        for field in CYCLE_TIME_FIELDS:
+            value = ct[field]
+            if value is not None:
+                sums[field] += value
+                counts[field] += 1
+        # PRs merged without any review
+        if ct["hours_to_first_review"] is None:
+            prs_without_review_count += 1
+
+    prs_without_review_pct = prs_without_review_count / len(prs) * 100
 
     return {
         "count": len(prs),
-        "avg_hours_before_first_commit": avg([ct["hours_before_first_commit"] for ct in cycle_times]),
-        "avg_hours_before_pr": avg([ct["hours_before_pr"] for ct in cycle_times]),
-        "avg_hours_to_first_review": avg([ct["hours_to_first_review"] for ct in cycle_times]),
-        "avg_hours_to_approval": avg([ct["hours_to_approval"] for ct in cycle_times]),
-        "avg_hours_to_merge": avg([ct["hours_to_merge"] for ct in cycle_times]),
-        "avg_total_hours": avg([ct["total_hours"] for ct in cycle_times]),
+        **{
+            f"avg_{field}": sums[field] / counts[field] if counts[field] else None
+            for field in CYCLE_TIME_FIELDS
+        },
         "prs_without_review_count": prs_without_review_count,
         "prs_without_review_pct": prs_without_review_pct,
-        "prs": cycle_times,
+        "prs": cycle_times if include_prs else [],
     }
 
 
 def get_velocity_metrics(
     db: DatabaseClient,
     repo: str | None = None,
-    granularity: str = "week",
+    granularity: Granularity = Granularity.WEEK,
     days: int = 90,
 ) -> dict:
     """Get shipping velocity metrics (PRs merged per time period)."""
     prs = db.get_prs(repo=repo, days=days, merged_only=True)
 
     # Group by author and time period
-    velocity_by_author: dict[str, dict[str, int]] = {}
-    velocity_totals: dict[str, int] = {}
+    velocity_by_author: defaultdict[str, Counter[str]] = defaultdict(Counter)
+    velocity_totals: Counter[str] = Counter()
 
+    weekly = granularity == Granularity.WEEK
     for pr in prs:
         merged_at = pr.get("merged_at")
         if not merged_at:
@@ -208,70 +341,55 @@ def get_velocity_metrics(
         author = pr["author_login"]
 
         # Determine period key
-        if granularity == "week":
+        if weekly:
             # ISO week start (Monday)
-            week_start = merged_at - timedelta(days=merged_at.weekday())
-            period_key = week_start.strftime("%Y-%m-%d")
+            week_start = merged_at.date() - timedelta(days=merged_at.weekday())
+            period_key = week_start.isoformat()
         else:  # month
-            period_key = merged_at.strftime("%Y-%m")
-
-        # Update author velocity
-        if author not in velocity_by_author:
-            velocity_by_author[author] = {}
-        velocity_by_author[author][period_key] = velocity_by_author[author].get(period_key, 0) + 1
+            period_key = f"{merged_at.year:04d}-{merged_at.month:02d}"
 
-        # Update totals
-        velocity_totals[period_key] = velocity_totals.get(period_key, 0) + 1
+        velocity_by_author[author][period_key] += 1
+        velocity_totals[period_key] += 1
 
-    # Get sorted list of periods
-    all_periods = sorted(set(velocity_totals.keys()))
+    # Get sorted list of periods (Counter keys are already unique)
+    all_periods = sorted(velocity_totals)
 
-    # Build per-author series
-    author_series = []
-    for author, periods in velocity_by_author.items():
-        data = [periods.get(p, 0) for p in all_periods]
-        total = sum(data)
-        author_series.append({
+    # Build per-author series; missing periods read as 0 from the Counter
+    author_series = [
+        {
             "author": author,
-            "data": data,
-            "total": total,
-        })
+            "data": [periods[p] for p in all_periods],
+            "total": periods.total(),
+        }
+        for author, periods in velocity_by_author.items()
+    ]
 
     # Sort by total (most productive first)
-    author_series.sort(key=lambda x: x["total"], reverse=True)
+    author_series.sort(key=itemgetter("total"), reverse=True)
 
     return {
         "granularity": granularity,
         "periods": all_periods,
-        "totals": [velocity_totals.get(p, 0) for p in all_periods],
+        "totals": [velocity_totals[p] for p in all_periods],
         "by_author": author_series,
         "total_prs": len(prs),
     }
 
 
 def get_summary_metrics(db: DatabaseClient, days: int = 30) -> dict:
-    """Get summary metrics for the dashboard overview."""
-    prs = db.get_prs(days=days)
-    merged_prs = [pr for pr in prs if pr.get("merged_at")]
-
-    # Calculate averages
-    total_hours = []
-    for pr in merged_prs:
-        hrs = hours_between(pr.get("created_at"), pr.get("merged_at"))
-        if hrs is not None:
-            total_hours.append(hrs)
-
-    avg_cycle_time = sum(total_hours) / len(total_hours) if total_hours else None
+    """Get summary metrics for the dashboard overview.
 
-    # Count unique authors
-    authors = set(pr["author_login"] for pr in prs)
+    Counts and the average cycle time are aggregated in SQL, so no PR rows
+    are transferred.
+    """
+    aggregates = db.get_summary_aggregates(days=days)
 
     return {
-        "total_prs": len(prs),
-        "merged_prs": len(merged_prs),
-        "open_prs": len([pr for pr in prs if pr["state"] == "open"]),
-        "avg_cycle_time_hours": avg_cycle_time,
-        "unique_authors": len(authors),
+        "total_prs": aggregates["total_prs"],
+        "merged_prs": aggregates["merged_prs"],
+        "open_prs": aggregates["open_prs"],
+        "avg_cycle_time_hours": aggregates["avg_cycle_time_hours"],
+        "unique_authors": aggregates["unique_authors"],
         "days": days,
     }
 
@@ -375,56 +493,38 @@ def extract_review_events(pr: dict) -> list[dict]:
     - submitted_at: datetime
     - is_bot: bool
     """
-    raw_data = pr.get("raw_data") or {}
-    reviews = raw_data.get("reviews") or []
-
-    events = []
-    for review in reviews:
-        # Handle both GraphQL (author) and REST (user) formats
-        reviewer = (
-            review.get("author", {}).get("login")
-            or review.get("user", {}).get("login")
-            or "unknown"
-        )
-        # Handle both GraphQL (submittedAt) and REST (submitted_at) formats
-        submitted = (
-            parse_review_timestamp(review.get("submittedAt"))
-            or parse_review_timestamp(review.get("submitted_at"))
-        )
-        if not submitted:
-            continue
-
-        events.append({
-            "reviewer": reviewer,
-            "state": review.get("state", "COMMENTED"),
-            "body": review.get("body") or "",
-            "submitted_at": submitted,
-            "is_bot": is_bot_user(reviewer),
-        })
-
-    # Sort by timestamp
-    events.sort(key=lambda e: e["submitted_at"])
-    return events
+    return list(_normalize_reviews(pr))
 
 
 def format_time_delta(seconds: float) -> str:
     """Format a time delta in seconds to human-readable form."""
     if seconds < 60:
-        secs = int(seconds)
-        return f"{secs} sec later" if secs == 1 else f"{secs} secs later"
+        count, unit = int(seconds), "sec"
     elif seconds < 3600:
-        mins = int(seconds / 60)
-        return f"{mins} min later" if mins == 1 else f"{mins} mins later"
-    elif seconds < 86400:
-        hours = seconds / 3600
-        if hours < 1.5:
-            return "1 hour later"
-        return f"{hours:.1f} hours later".replace(".0 ", " ")
+        count, unit = int(seconds / 60), "min"
     else:
-        days = seconds / 86400
-        if days < 1.5:
-            return "1 day later"
-        return f"{days:.1f} days later".replace(".0 ", " ")
+        # Hours and days get one decimal place, trimmed when it is .0
+        if seconds < 86400:
+            value, unit = seconds / 3600, "hour"
+        else:
+            value, unit = seconds / 86400, "day"
+        if value < 1.5:
+            return f"1 {unit} later"
+        text = f"{value:.1f}"
+        if text.endswith(".0"):
+            text = text[:-2]
+        return f"{text} {unit}s later"
+
+    return f"{count} {unit} later" if count == 1 else f"{count} {unit}s later"
+
+
+# Display labels for review states on the PR timeline
+REVIEW_STATE_LABELS = {
+    "APPROVED": "Approved",
+    "CHANGES_REQUESTED": "Changes requested",
+    "COMMENTED": "Commented",
+    "DISMISSED": "Review dismissed",
+}
 
 
 def build_pr_timeline(pr: dict, claude_sessions: list[dict]) -> list[dict]:
@@ -445,21 +545,26 @@ def build_pr_timeline(pr: dict, claude_sessions: list[dict]) -> list[dict]:
     - expandable: bool
     - time_delta: str (relative time from previous event)
     """
-    events = []
-
-    # Add Claude session events
-    for session in claude_sessions:
-        events.append({
+    # Each component below is put in timestamp order (reviews are normalized
+    # in submission order), so the runs are merged rather than re-sorted.
+    claude_events = [
+        {
             "type": "claude_session",
             "timestamp": session["first_message_at"],
             "title": f"Claude session ({session['message_count']} messages)",
             "detail": session,
             "expandable": True,
-        })
+        }
+        for session in claude_sessions
+    ]
+    # Callers usually pass sessions sorted by first_message_at, in which case
+    # this is a linear check, but don't rely on it
+    claude_events.sort(key=itemgetter("timestamp"))
 
     # Add first commit
+    commit_events = []
     if pr.get("first_commit_at"):
-        events.append({
+        commit_events.append({
             "type": "first_commit",
             "timestamp": pr["first_commit_at"],
             "title": "First commit",
@@ -468,8 +573,9 @@ def build_pr_timeline(pr: dict, claude_sessions: list[dict]) -> list[dict]:
         })
 
     # Add PR opened
+    opened_events = []
     if pr.get("created_at"):
-        events.append({
+        opened_events.append({
             "type": "pr_opened",
             "timestamp": pr["created_at"],
             "title": "PR opened",
@@ -478,16 +584,13 @@ def build_pr_timeline(pr: dict, claude_sessions: list[dict]) -> list[dict]:
         })
 
     # Add review events
-    review_events = extract_review_events(pr)
-    for review in review_events:
-        state_label = {
-            "APPROVED": "Approved",
-            "CHANGES_REQUESTED": "Changes requested",
-            "COMMENTED": "Commented",
-            "DISMISSED": "Review dismissed",
-        }.get(review["state"], review["state"])
-
-        events.append({
+    review_events = []
+    append = review_events.append
+    for review in _normalize_reviews(pr):
+        state = review["state"]
+        state_label = REVIEW_STATE_LABELS.get(state, state)
+
+        append({
             "type": "review",
             "timestamp": review["submitted_at"],
             "title": f"{review['reviewer']} - {state_label}",
@@ -496,8 +599,9 @@ def build_pr_timeline(pr: dict, claude_sessions: list[dict]) -> list[dict]:
         })
 
     # Add merged event
+    merged_events = []
     if pr.get("merged_at"):
-        events.append({
+        merged_events.append({
             "type": "merged",
             "timestamp": pr["merged_at"],
             "title": "PR merged",
@@ -505,22 +609,44 @@ def build_pr_timeline(pr: dict, claude_sessions: list[dict]) -> list[dict]:
             "expandable": False,
         })
 
-    # Sort all events by timestamp
-    events.sort(key=lambda e: e["timestamp"])
-
-    # Add time deltas relative to previous event
-    for i, event in enumerate(events):
-        if i == 0:
-            event["time_delta"] = "Start"
-        else:
-            prev_ts = events[i - 1]["timestamp"]
-            curr_ts = event["timestamp"]
-            delta_seconds = (curr_ts - prev_ts).total_seconds()
+    # Merge by timestamp (ties keep the order above) and add time deltas
+    # relative to the previous event in the same pass
+    events = []
+    append = events.append
+    for event in heapq.merge(
+        claude_events,
+        commit_events,
+        opened_events,
+        review_events,
+        merged_events,
+        key=itemgetter("timestamp"),
+    ):
+        if events:
+            delta_seconds = (event["timestamp"] - events[-1]["timestamp"]).total_seconds()
             event["time_delta"] = format_time_delta(delta_seconds)
+        else:
+            event["time_delta"] = "Start"
+        append(event)
 
     return events
 
 
+# Keywords looked for in human review bodies, mapped to summary themes
+REVIEW_KEYWORDS = {
+    "lgtm": "LGTM",
+    "ship it": "Ship it",
+    "nit": "Minor nits",
+    "typo": "Typo fixes",
+    "test": "Testing feedback",
+    "security": "Security concerns",
+    "performance": "Performance considerations",
+}
+# Zero-width lookahead so overlapping keywords are all reported
+_REVIEW_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in REVIEW_KEYWORDS) + "))"
+)
+
+
 def generate_review_summary(pr: dict) -> str:
     """Generate a summary of PR commentary.
 
@@ -529,19 +655,25 @@ def generate_review_summary(pr: dict) -> str:
     - List of reviewers
     - Key feedback themes
     """
-    review_events = extract_review_events(pr)
-    human_reviews = [r for r in review_events if not r["is_bot"]]
-
-    if not human_reviews:
+    # Tally states, reviewers and keywords in a single pass
+    state_counts: Counter[str] = Counter()
+    reviewers_seen = set()
+    keywords_seen = set()
+    for r in iter_human_reviews(pr):
+        state_counts[r["state"]] += 1
+        reviewers_seen.add(r["reviewer"])
+        if r["body"]:
+            keywords_seen.update(m.group(1) for m in _REVIEW_KEYWORD_RE.finditer(r["body"].lower()))
+
+    if not reviewers_seen:
         return "No human reviews on this PR."
 
-    # Count by state
-    approvals = [r for r in human_reviews if r["state"] == "APPROVED"]
-    changes_requested = [r for r in human_reviews if r["state"] == "CHANGES_REQUESTED"]
-    comments = [r for r in human_reviews if r["state"] == "COMMENTED"]
+    approvals = state_counts["APPROVED"]
+    changes_requested = state_counts["CHANGES_REQUESTED"]
+    comments = state_counts["COMMENTED"]
 
     # Unique reviewers
-    reviewers = sorted(set(r["reviewer"] for r in human_reviews))
+    reviewers = sorted(reviewers_seen)
 
     # Build summary
     parts = []
@@ -552,30 +684,19 @@ def generate_review_summary(pr: dict) -> str:
     # Counts
     counts = []
     if approvals:
-        counts.append(f"{len(approvals)} approval{'s' if len(approvals) > 1 else ''}")
+        counts.append(f"{approvals} approval{'s' if approvals > 1 else ''}")
     if changes_requested:
-        counts.append(f"{len(changes_requested)} change request{'s' if len(changes_requested) > 1 else ''}")
+        counts.append(f"{changes_requested} change request{'s' if changes_requested > 1 else ''}")
     if comments:
-        counts.append(f"{len(comments)} comment{'s' if len(comments) > 1 else ''}")
+        counts.append(f"{comments} comment{'s' if comments > 1 else ''}")
 
     if counts:
         parts.append(f"**Activity:** {', '.join(counts)}")
 
-    # Look for common keywords in bodies
-    all_bodies = " ".join(r["body"].lower() for r in human_reviews if r["body"])
-    keywords_found = []
-    keyword_map = {
-        "lgtm": "LGTM",
-        "ship it": "Ship it",
-        "nit": "Minor nits",
-        "typo": "Typo fixes",
-        "test": "Testing feedback",
-        "security": "Security concerns",
-        "performance": "Performance considerations",
-    }
-    for keyword, label in keyword_map.items():
-        if keyword in all_bodies:
-            keywords_found.append(label)
+    # Common keywords in bodies
+    keywords_found = [
+        label for keyword, label in REVIEW_KEYWORDS.items() if keyword in keywords_seen
+    ]
 
     if keywords_found:
         parts.append(f"**Themes:** {', '.join(keywords_found)}")
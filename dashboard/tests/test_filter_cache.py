@@ -0,0 +1,64 @@
+"""Tests for the cached repo/author filter lists."""
+
+import pytest
+
+from dashboard.main import app
+from dashboard.routers import dashboard as dashboard_views
+
+
+class CountingDB:
+    """Stand-in for DatabaseClient that counts get_repos calls."""
+
+    def __init__(self, repos: list[str]):
+        self.repos = repos
+        self.calls = 0
+
+    def get_repos(self) -> list[str]:
+        self.calls += 1
+        return self.repos
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Pin the cache clock and data version; yields a mutable [now]."""
+    now = [1000.0]
+    monkeypatch.setattr(dashboard_views.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(app.state, "data_version", 0, raising=False)
+    monkeypatch.setattr(dashboard_views, "_filter_cache", {})
+    return now
+
+
+class TestGetRepos:
+    """Tests for the get_repos dependency."""
+
+    def test_cached_within_version_and_ttl(self, clock):
+        """Test that repeated calls reuse the list until the data version changes."""
+        db = CountingDB(["o/r"])
+
+        assert dashboard_views.get_repos(db) == ["o/r"]
+        assert dashboard_views.get_repos(db) == ["o/r"]
+        assert db.calls == 1
+
+        app.state.data_version = 1
+        dashboard_views.get_repos(db)
+        assert db.calls == 2
+
+    def test_expires_after_ttl(self, clock):
+        """Test that the list is refetched once the TTL passes without a sync."""
+        db = CountingDB(["o/r"])
+
+        dashboard_views.get_repos(db)
+        clock[0] += dashboard_views.FILTER_CACHE_TTL + 1
+        dashboard_views.get_repos(db)
+
+        assert db.calls == 2
+
+    def test_empty_result_not_cached(self, clock):
+        """Test that an empty (possibly failed) fetch is retried on the next call."""
+        db = CountingDB([])
+
+        assert dashboard_views.get_repos(db) == []
+        db.repos = ["o/r"]
+
+        assert dashboard_views.get_repos(db) == ["o/r"]
+        assert db.calls == 2
@@ -3,7 +3,69 @@
 import pytest
 from datetime import datetime, timezone
 
-from dashboard.services.metrics import extract_review_events, get_human_review_times
+from dashboard.services.metrics import (
+    build_pr_timeline,
+    calculate_pr_cycle_time,
+    extract_review_events,
+    format_time_delta,
+    generate_review_summary,
+    get_cycle_time_metrics,
+    get_human_review_times,
+    get_velocity_metrics,
+    is_bot_user,
+)
+
+
+class StubDB:
+    """Minimal stand-in for DatabaseClient returning canned PR rows."""
+
+    def __init__(self, prs: list[dict]):
+        self.prs = prs
+
+    def get_prs(self, repo=None, author=None, days=30, merged_only=False):
+        return [pr for pr in self.prs if pr.get("merged_at") or not merged_only]
+
+    def get_cycle_time_rows(self, repo=None, author=None, days=30):
+        return self.get_prs(merged_only=True)
+
+
+def make_pr(reviews: list[dict] | None = None, **overrides) -> dict:
+    """Build a merged PR row; keyword arguments override individual columns."""
+    pr = {
+        "pr_number": 1,
+        "repo_full_name": "org/repo",
+        "title": "PR 1",
+        "author_login": "dev",
+        "first_claude_chat_at": None,
+        "first_commit_at": datetime(2026, 1, 15, 6, 0, 0, tzinfo=timezone.utc),
+        "created_at": datetime(2026, 1, 15, 8, 0, 0, tzinfo=timezone.utc),
+        "merged_at": datetime(2026, 1, 15, 16, 0, 0, tzinfo=timezone.utc),
+        "raw_data": {"reviews": reviews or []},
+    }
+    pr.update(overrides)
+    return pr
+
+
+class TestIsBotUser:
+    """Tests for is_bot_user function."""
+
+    def test_bot_patterns_match(self):
+        """Test that logins containing any bot pattern are flagged."""
+        assert is_bot_user("dependabot[bot]") is True
+        assert is_bot_user("github-actions") is True
+        assert is_bot_user("Renovate-Bot") is True
+        assert is_bot_user("claude") is True
+        assert is_bot_user("my-copilot-helper") is True
+
+    def test_humans_not_flagged(self):
+        """Test that ordinary logins are not flagged."""
+        assert is_bot_user("human-reviewer") is False
+        assert is_bot_user("robert") is False
+
+    def test_empty_username(self):
+        """Test that empty or missing usernames are not bots."""
+        assert is_bot_user("") is False
+        assert is_bot_user(None) is False
 
 
 class TestExtractReviewEvents:
@@ -171,6 +233,23 @@ class TestExtractReviewEvents:
         assert len(events) == 1
         assert events[0]["reviewer"] == "reviewer2"
 
+    def test_review_malformed_timestamp_skipped(self):
+        """Test that unparseable or non-string timestamps are skipped, not raised."""
+        pr = {
+            "raw_data": {
+                "reviews": [
+                    {"state": "APPROVED", "author": {"login": "r1"}, "submittedAt": "not a date"},
+                    {"state": "APPROVED", "author": {"login": "r2"}, "submittedAt": ["2026-01-15"]},
+                    {"state": "APPROVED", "author": {"login": "r3"}, "submittedAt": {"at": 1}},
+                    {"state": "APPROVED", "author": {"login": "r4"}, "submittedAt": "2026-01-15T10:00:00Z"},
+                ]
+            }
+        }
+
+        events = extract_review_events(pr)
+
+        assert [e["reviewer"] for e in events] == ["r4"]
+
     def test_review_missing_author_uses_unknown(self):
         """Test that reviews without author default to 'unknown'."""
         pr = {
@@ -190,6 +269,25 @@ class TestExtractReviewEvents:
         assert len(events) == 1
         assert events[0]["reviewer"] == "unknown"
 
+    def test_review_null_author_uses_unknown(self):
+        """Test that a null author (deleted account) defaults to 'unknown'."""
+        pr = {
+            "raw_data": {
+                "reviews": [
+                    {
+                        "state": "COMMENTED",
+                        "author": None,
+                        "submittedAt": "2026-01-15T10:00:00Z",
+                    },
+                ]
+            }
+        }
+
+        events = extract_review_events(pr)
+
+        assert len(events) == 1
+        assert events[0]["reviewer"] == "unknown"
+
 
 class TestGetHumanReviewTimes:
     """Tests for get_human_review_times function."""
@@ -271,3 +369,305 @@ class TestGetHumanReviewTimes:
 
         assert first_review is None
         assert approved is None
+
+    def test_unsorted_reviews(self):
+        """Test that the earliest human review and approval win regardless of order."""
+        pr = {
+            "raw_data": {
+                "reviews": [
+                    {
+                        "state": "APPROVED",
+                        "author": {"login": "late-approver"},
+                        "submittedAt": "2026-01-15T15:00:00Z",
+                    },
+                    {
+                        "state": "APPROVED",
+                        "author": {"login": "early-approver"},
+                        "submittedAt": "2026-01-15T12:00:00Z",
+                    },
+                    {
+                        "state": "COMMENTED",
+                        "author": {"login": "commenter"},
+                        "submittedAt": "2026-01-15T09:00:00Z",
+                    },
+                ]
+            }
+        }
+
+        first_review, approved = get_human_review_times(pr)
+
+        assert first_review == datetime(2026, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
+        assert approved == datetime(2026, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class TestCalculatePrCycleTime:
+    """Tests for calculate_pr_cycle_time function."""
+
+    # Stored columns say reviewer1 reviewed at 9:00 and approved at 10:00,
+    # while raw_data has a single human approval at 12:00
+    STORED_REVIEWS = {
+        "first_review_at": datetime(2026, 1, 15, 9, 0, 0, tzinfo=timezone.utc),
+        "first_reviewer_login": "reviewer1",
+        "approved_at": datetime(2026, 1, 15, 10, 0, 0, tzinfo=timezone.utc),
+        "approver_login": "reviewer1",
+    }
+    RAW_REVIEWS = [
+        {
+            "state": "APPROVED",
+            "author": {"login": "reviewer2"},
+            "submittedAt": "2026-01-15T12:00:00Z",
+        },
+    ]
+
+    def test_uses_stored_times_for_human_reviewers(self):
+        """Test that stored times are used when both stored logins are human."""
+        result = calculate_pr_cycle_time(make_pr(self.RAW_REVIEWS, **self.STORED_REVIEWS))
+
+        assert result["hours_to_first_review"] == 1.0
+        assert result["hours_to_approval"] == 2.0
+
+    def test_bot_first_reviewer_falls_back_to_raw_data(self):
+        """Test that a bot first reviewer forces the human-only raw_data scan."""
+        pr = make_pr(self.RAW_REVIEWS, **self.STORED_REVIEWS)
+        pr["first_reviewer_login"] = "dependabot[bot]"
+
+        result = calculate_pr_cycle_time(pr)
+
+        assert result["hours_to_first_review"] == 4.0
+        assert result["hours_to_approval"] == 4.0
+
+    def test_missing_login_columns_fall_back_to_raw_data(self):
+        """Test that rows without stored reviewer logins use raw_data."""
+        pr = make_pr(
+            self.RAW_REVIEWS,
+            first_review_at=self.STORED_REVIEWS["first_review_at"],
+            approved_at=self.STORED_REVIEWS["approved_at"],
+        )
+
+        result = calculate_pr_cycle_time(pr)
+
+        assert result["hours_to_first_review"] == 4.0
+
+    def test_unknown_approver_falls_back_to_raw_data(self):
+        """Test that an approval without a stored login uses raw_data."""
+        pr = make_pr(self.RAW_REVIEWS, **self.STORED_REVIEWS)
+        pr["approver_login"] = None
+
+        result = calculate_pr_cycle_time(pr)
+
+        assert result["hours_to_approval"] == 4.0
+
+
+class TestGetCycleTimeMetrics:
+    """Tests for get_cycle_time_metrics function."""
+
+    def test_averages_skip_missing_values(self):
+        """Test that averages ignore PRs without a value for that metric."""
+        reviewed = make_pr([
+            {
+                "state": "APPROVED",
+                "author": {"login": "reviewer1"},
+                "submittedAt": "2026-01-15T12:00:00Z",
+            },
+        ])
+        unreviewed = make_pr([
+            {
+                "state": "APPROVED",
+                "author": {"login": "dependabot[bot]"},
+                "submittedAt": "2026-01-15T09:00:00Z",
+            },
+        ], pr_number=2)
+
+        result = get_cycle_time_metrics(StubDB([reviewed, unreviewed]))
+
+        assert result["count"] == 2
+        assert result["avg_hours_before_first_commit"] is None
+        assert result["avg_hours_before_pr"] == 2.0
+        assert result["avg_hours_to_first_review"] == 4.0
+        assert result["avg_hours_to_approval"] == 4.0
+        assert result["avg_hours_to_merge"] == 4.0
+        assert result["avg_total_hours"] == 10.0
+        assert result["prs_without_review_count"] == 1
+        assert result["prs_without_review_pct"] == 50.0
+        assert [ct["pr_number"] for ct in result["prs"]] == [1, 2]
+
+    def test_without_prs(self):
+        """Test that include_prs=False keeps the averages but drops the PR list."""
+        pr = make_pr([
+            {
+                "state": "APPROVED",
+                "author": {"login": "reviewer1"},
+                "submittedAt": "2026-01-15T12:00:00Z",
+            },
+        ])
+
+        result = get_cycle_time_metrics(StubDB([pr]), include_prs=False)
+
+        assert result["count"] == 1
+        assert result["avg_hours_to_approval"] == 4.0
+        assert result["prs"] == []
+
+    def test_no_prs(self):
+        """Test that an empty window returns empty averages."""
+        result = get_cycle_time_metrics(StubDB([]))
+
+        assert result["count"] == 0
+        assert result["avg_total_hours"] is None
+        assert result["prs"] == []
+
+
+class TestGetVelocityMetrics:
+    """Tests for get_velocity_metrics function."""
+
+    def test_weekly_buckets(self):
+        """Test that PRs are bucketed by the Monday of their merge week."""
+        prs = [
+            make_pr(author_login="alice", merged_at=datetime(2026, 1, 14, 23, tzinfo=timezone.utc)),  # Wed
+            make_pr(author_login="alice", merged_at=datetime(2026, 1, 12, 1, tzinfo=timezone.utc)),  # Mon
+            make_pr(author_login="bob", merged_at=datetime(2026, 1, 18, 9, tzinfo=timezone.utc)),  # Sun
+            make_pr(author_login="bob", merged_at=datetime(2026, 1, 19, 9, tzinfo=timezone.utc)),  # Mon
+            make_pr(author_login="bob", merged_at=datetime(2026, 1, 20, 9, tzinfo=timezone.utc)),
+        ]
+
+        result = get_velocity_metrics(StubDB(prs), granularity="week")
+
+        assert result["periods"] == ["2026-01-12", "2026-01-19"]
+        assert result["totals"] == [3, 2]
+        assert result["by_author"] == [
+            {"author": "bob", "data": [1, 2], "total": 3},
+            {"author": "alice", "data": [2, 0], "total": 2},
+        ]
+        assert result["total_prs"] == 5
+
+    def test_monthly_buckets(self):
+        """Test that PRs are bucketed by merge month."""
+        prs = [
+            make_pr(author_login="alice", merged_at=datetime(2025, 12, 31, 23, tzinfo=timezone.utc)),
+            make_pr(author_login="alice", merged_at=datetime(2026, 1, 1, 0, tzinfo=timezone.utc)),
+        ]
+
+        result = get_velocity_metrics(StubDB(prs), granularity="month")
+
+        assert result["periods"] == ["2025-12", "2026-01"]
+        assert result["totals"] == [1, 1]
+        assert result["by_author"] == [{"author": "alice", "data": [1, 1], "total": 2}]
+
+
+class TestBuildPrTimeline:
+    """Tests for build_pr_timeline function."""
+
+    def test_unsorted_sessions_are_ordered(self):
+        """Test that sessions passed out of order still produce a time-ordered timeline."""
+        pr = {
+            "created_at": datetime(2026, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+            "raw_data": {"reviews": []},
+        }
+        sessions = [
+            {
+                "first_message_at": datetime(2026, 1, 15, 10, 0, 0, tzinfo=timezone.utc),
+                "message_count": 2,
+            },
+            {
+                "first_message_at": datetime(2026, 1, 15, 8, 0, 0, tzinfo=timezone.utc),
+                "message_count": 5,
+            },
+        ]
+
+        events = build_pr_timeline(pr, sessions)
+
+        assert [e["timestamp"].hour for e in events] == [8, 10, 12]
+        assert [e["time_delta"] for e in events] == ["Start", "2 hours later", "2 hours later"]
+
+
+class TestGenerateReviewSummary:
+    """Tests for generate_review_summary function."""
+
+    def test_summary_of_human_reviews(self):
+        """Test reviewer list, activity counts and themes from human reviews."""
+        pr = {
+            "raw_data": {
+                "reviews": [
+                    {
+                        "state": "COMMENTED",
+                        "author": {"login": "dependabot[bot]"},
+                        "submittedAt": "2026-01-15T09:00:00Z",
+                        "body": "Security advisory",
+                    },
+                    {
+                        "state": "CHANGES_REQUESTED",
+                        "author": {"login": "bob"},
+                        "submittedAt": "2026-01-15T10:00:00Z",
+                        "body": "Please add a Unit TEST, and fix the typo.",
+                    },
+                    {
+                        "state": "COMMENTED",
+                        "author": {"login": "alice"},
+                        "submittedAt": "2026-01-15T11:00:00Z",
+                        "body": "",
+                    },
+                    {
+                        "state": "APPROVED",
+                        "author": {"login": "bob"},
+                        "submittedAt": "2026-01-15T12:00:00Z",
+                        "body": "LGTM",
+                    },
+                    {
+                        "state": "APPROVED",
+                        "user": {"login": "alice"},
+                        "submitted_at": "2026-01-15T13:00:00Z",
+                    },
+                ]
+            }
+        }
+
+        summary = generate_review_summary(pr)
+
+        assert summary == (
+            "**Reviewers:** alice, bob\n\n"
+            "**Activity:** 2 approvals, 1 change request, 1 comment\n\n"
+            "**Themes:** LGTM, Minor nits, Typo fixes, Testing feedback"
+        )
+
+    def test_only_bot_reviews(self):
+        """Test the message for PRs reviewed only by bots."""
+        pr = {
+            "raw_data": {
+                "reviews": [
+                    {
+                        "state": "APPROVED",
+                        "author": {"login": "dependabot[bot]"},
+                        "submittedAt": "2026-01-15T09:00:00Z",
+                    },
+                ]
+            }
+        }
+
+        assert generate_review_summary(pr) == "No human reviews on this PR."
+
+
+class TestFormatTimeDelta:
+    """Tests for format_time_delta function."""
+
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [
+            (0, "0 secs later"),
+            (1.9, "1 sec later"),
+            (59, "59 secs later"),
+            (60, "1 min later"),
+            (150, "2 mins later"),
+            (3599, "59 mins later"),
+            (3600, "1 hour later"),
+            (5399, "1 hour later"),
+            (5400, "1.5 hours later"),
+            (7200, "2 hours later"),
+            (86399, "24 hours later"),
+            (86400, "1 day later"),
+            (129600, "1.5 days later"),
+            (172800, "2 days later"),
+            (864000, "10 days later"),
+        ],
+    )
+    def test_formatting(self, seconds, expected):
+        """Test each unit tier, singular forms and trailing .0 trimming."""
+        assert format_time_delta(seconds) == expected
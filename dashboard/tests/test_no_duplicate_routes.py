@@ -0,0 +1,23 @@
+"""Tests for route registration."""
+
+from collections import Counter
+
+from dashboard.routers import api
+from dashboard.routers import dashboard as dashboard_views
+
+
+class TestNoDuplicateRoutes:
+    """Each (method, path) must be served by exactly one handler."""
+
+    def test_routes_are_unique(self):
+        """Test that no method/path pair is registered twice across routers."""
+        routes = Counter(
+            (method, route.path)
+            for router in (api.router, dashboard_views.router)
+            for route in router.routes
+            for method in route.methods
+        )
+
+        duplicates = [key for key, count in routes.items() if count > 1]
+
+        assert duplicates == []
@@ -0,0 +1,77 @@
+"""Tests for coalescing concurrent metric fetches."""
+
+import asyncio
+import threading
+
+import pytest
+
+from dashboard.routers.dashboard import _inflight, _singleflight
+
+
+class TestSingleflight:
+    """Tests for the _singleflight helper."""
+
+    def test_concurrent_calls_share_one_fetch(self):
+        """Test that identical concurrent calls run the fetch once."""
+        calls = []
+        release = threading.Event()
+
+        def fetch(days):
+            calls.append(days)
+            release.wait(5)
+            return {"days": days}
+
+        async def run():
+            first = asyncio.ensure_future(_singleflight(("summary", 7), fetch, 7))
+            second = asyncio.ensure_future(_singleflight(("summary", 7), fetch, 7))
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(first, second)
+
+        results = asyncio.run(run())
+
+        assert results == [{"days": 7}, {"days": 7}]
+        assert calls == [7]
+        assert _inflight == {}
+
+    def test_exception_reaches_every_caller(self):
+        """Test that a failed fetch raises in all coalesced callers."""
+        release = threading.Event()
+
+        def fetch():
+            release.wait(5)
+            raise RuntimeError("db down")
+
+        async def run():
+            first = asyncio.ensure_future(_singleflight(("summary", 30), fetch))
+            second = asyncio.ensure_future(_singleflight(("summary", 30), fetch))
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(first, second, return_exceptions=True)
+
+        results = asyncio.run(run())
+
+        assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+        assert _inflight == {}
+
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that cancelling the caller that started a fetch leaves the others waiting on it."""
+        release = threading.Event()
+
+        def fetch():
+            release.wait(5)
+            return "result"
+
+        async def run():
+            leader = asyncio.ensure_future(_singleflight(("summary", 90), fetch))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(_singleflight(("summary", 90), fetch))
+            await asyncio.sleep(0.05)
+            leader.cancel()
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        assert asyncio.run(run()) == "result"
+        assert _inflight == {}
@@ -0,0 +1,26 @@
+"""Tests for the orjson-backed tojson filter."""
+
+import pytest
+
+from dashboard.routers.dashboard import templates
+
+
+class TestToJson:
+    """Tests for tojson rendering through _orjson_dumps."""
+
+    def test_sorts_keys_and_escapes_html(self):
+        """Test that the default policy sorts keys and HTML characters stay escaped."""
+        html = templates.env.from_string("{{ x | tojson }}").render(x={"b": 1, "a": "<"})
+
+        assert html == '{"a":"\\u003c","b":1}'
+
+    def test_indent_two(self):
+        """Test that indent=2 is honoured."""
+        html = templates.env.from_string("{{ x | tojson(indent=2) }}").render(x={"a": 1})
+
+        assert html == '{\n  "a": 1\n}'
+
+    def test_unsupported_indent_raises(self):
+        """Test that an indent orjson cannot produce fails loudly."""
+        with pytest.raises(ValueError):
+            templates.env.from_string("{{ x | tojson(indent=4) }}").render(x={"a": 1})